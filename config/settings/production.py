@@ -18,7 +18,12 @@ from .base import env
 # https://docs.djangoproject.com/en/dev/ref/settings/#secret-key
 SECRET_KEY = env("DJANGO_SECRET_KEY")
 # https://docs.djangoproject.com/en/dev/ref/settings/#allowed-hosts
-ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["neuromancers.org.uk"])
+# env.list() splits on "," only, so strip hosts to accept "a.com, b.com" too.
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in env.list("DJANGO_ALLOWED_HOSTS", default=["neuromancers.org.uk"])
+    if host.strip()
+]
 
 # DATABASES
 # ------------------------------------------------------------------------------
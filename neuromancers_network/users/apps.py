@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.contrib.auth.password_validation import get_default_password_validators
 from django.utils.translation import gettext_lazy as _
 
 
@@ -8,5 +9,8 @@ class UsersConfig(AppConfig):
 
     def ready(self):
         """
-        Override this method in subclasses to run code when Django starts.
+        Build the (cached) password validators when Django starts, so the
+        CommonPasswordValidator word list is read from disk at worker boot
+        rather than during the first signup or password change.
         """
+        get_default_password_validators()